@@ -115,7 +115,7 @@ static void ensure_csv(const char *path) {
         fprintf(stderr, "Tried path: %s\n", path);
         return;
     }
-    fprintf(f, "language,matrix_size,run_index,elapsed_sec,memory_used_mb,timestamp_iso\n");
+    fprintf(f, "language,matrix_size,run_index,elapsed_sec,memory_used_mb,timestamp_iso,dtype,median_sec,mad_sec\n");
     fclose(f);
 }
 
@@ -130,7 +130,7 @@ static void append_csv(const char *path, int n, int run_index, double elapsed, l
     struct tm *tm = localtime(&t);
     char iso[32];
     strftime(iso, sizeof(iso), "%Y-%m-%dT%H:%M:%S", tm);
-    fprintf(f, "C,%d,%d,%.6f,%ld,%s\n", n, run_index, elapsed, mem_used_mb, iso);
+    fprintf(f, "C,%d,%d,%.6f,%ld,%s,f64,,\n", n, run_index, elapsed, mem_used_mb, iso);
     fclose(f);
 }
 
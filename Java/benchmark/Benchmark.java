@@ -14,7 +14,7 @@ public class Benchmark {
         Files.createDirectories(p.toAbsolutePath().getParent());
         if (!Files.exists(p)) {
             try (BufferedWriter w = Files.newBufferedWriter(p)) {
-                w.write("language,matrix_size,run_index,elapsed_sec,memory_used_mb,timestamp_iso");
+                w.write("language,matrix_size,run_index,elapsed_sec,memory_used_mb,timestamp_iso,dtype,median_sec,mad_sec");
                 w.newLine();
             }
         }
@@ -101,7 +101,10 @@ public class Benchmark {
                         Integer.toString(r),
                         Double.toString(elapsed),
                         Double.toString(memUsedMB),
-                        ts
+                        ts,
+                        "f64",
+                        "",
+                        ""
                 );
 
                 appendCsv(CSV, line);
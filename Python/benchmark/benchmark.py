@@ -1,66 +1,147 @@
-import os, sys, time, random, psutil, csv
+import os, sys, time, gc, tracemalloc, csv, argparse
 from datetime import datetime
 
+# Pin BLAS/OpenMP thread pools before NumPy loads them; override via the environment
+for var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+    os.environ.setdefault(var, str(os.cpu_count()))
+
+import numpy as np
+
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from src.matrix_mult import matrix_multiply
+from src.matrix_mult import matrix_multiply, matrix_multiply_python, matrix_multiply_strassen
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 RESULTS_PATH = os.path.normpath(os.path.join(SCRIPT_DIR, "..", "..", "data", "results.csv"))
+# "Python" stays the pure-loop baseline, as in the historical rows and the paper
+LANGUAGE_TAGS = {"numpy": "PythonNumPy", "strassen": "PythonStrassen", "numba": "PythonNumba",
+                 "tiled": "PythonNumbaTiled", "packed": "PythonNumbaPacked", "python": "Python",
+                 "cupy": "PythonCuPy"}
+KERNELS = {"numpy": matrix_multiply, "strassen": matrix_multiply_strassen, "python": matrix_multiply_python}
+# Loaded on demand from src.matrix_mult_numba (optional dependency, compiles at import)
+NUMBA_KERNELS = {"numba": "matrix_multiply_numba", "tiled": "matrix_multiply_tiled",
+                 "packed": "matrix_multiply_packed"}
+# float32 halves the bytes moved and doubles SIMD lanes; results are not bit-identical to f64
+DTYPES = {"f32": np.float32, "f64": np.float64}
+SEED = 0
+rng = np.random.default_rng(SEED)
 
 def ensure_csv():
     os.makedirs(os.path.dirname(RESULTS_PATH), exist_ok=True)
     if not os.path.exists(RESULTS_PATH):
         with open(RESULTS_PATH, "w", newline="") as f:
             writer = csv.writer(f)
-            writer.writerow(["language", "matrix_size", "run_index", "elapsed_sec", "memory_used_mb", "timestamp_iso"])
+            writer.writerow(["language", "matrix_size", "run_index", "elapsed_sec", "memory_used_mb", "timestamp_iso", "dtype",
+                             "median_sec", "mad_sec"])
 
-def log_csv(n, run_index, elapsed_sec, mem_used_mb):
+def log_csv(rows):
     with open(RESULTS_PATH, "a", newline="") as f:
         writer = csv.writer(f)
-        writer.writerow(["Python", n, run_index, f"{elapsed_sec:.6f}",
-                         f"{mem_used_mb:.2f}", datetime.now().isoformat(timespec="seconds")])
+        writer.writerows(rows)
 
-def create_matrix(n):
-    return [[random.random() for _ in range(n)] for _ in range(n)]
+def create_matrix(n, dtype=np.float64):
+    return rng.random((n, n), dtype=dtype)
 
-def get_memory_mb():
-    return psutil.Process(os.getpid()).memory_info().rss / (1024**2)
+def traced_peak_mb(mm, A, B, C, n):
+    gc.collect()
+    tracemalloc.start()
+    mem_before, _ = tracemalloc.get_traced_memory()
+    mm(A, B, C, n)
+    _, mem_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return max(0, mem_peak - mem_before) / (1024**2)
 
-def run_experiment(n, runs):
+def run_experiment(n, runs, backend="numpy", dtype="f64"):
+    if backend == "python" and dtype != "f64":
+        # tolist() turns the inputs into Python floats, so the pure loop always computes in f64
+        raise ValueError("The pure-Python backend only supports --dtype f64")
     ensure_csv()
-    A = create_matrix(n)
-    B = create_matrix(n)
+    # One timestamp per experiment; nothing but the multiply runs between t0 and t1
+    ts = datetime.now().isoformat(timespec="seconds")
+    A = create_matrix(n, DTYPES[dtype])
+    B = create_matrix(n, DTYPES[dtype])
+    # Output buffer allocated once so allocation is not charged to the GEMM
+    C = np.empty((n, n), dtype=DTYPES[dtype])
+    if backend == "python":
+        A, B, C = A.tolist(), B.tolist(), C.tolist()
+
+    if backend == "cupy":
+        # Optional GPU backend, imported only when requested; operands uploaded once
+        from src.matrix_mult_cupy import matrix_multiply_cupy as mm, to_device, device_peak_mb
+        A, B, C = to_device(A), to_device(B), to_device(C)
+        # tracemalloc only sees host allocations; measure the device pool instead
+        probe_mb = device_peak_mb
+    elif backend in NUMBA_KERNELS:
+        # Optional JIT backends, imported only when requested
+        from src import matrix_mult_numba
+        mm = getattr(matrix_mult_numba, NUMBA_KERNELS[backend])
+        probe_mb = traced_peak_mb
+    else:
+        mm = KERNELS[backend]
+        probe_mb = traced_peak_mb
 
     print("=========== PYTHON BENCHMARK ===========")
-    print(f"Matrix size: {n}x{n} | Runs: {runs}")
+    print(f"Matrix size: {n}x{n} | Runs: {runs} | Backend: {backend} | dtype: {dtype}")
+
+    mem_used = None
+    if backend != "python":
+        # One-time runtime start-up (Numba/BLAS thread pools, cuBLAS handle) on a 4x4 copy so
+        # it is not traced as the kernel's own memory
+        mm(A[:4, :4].copy(), B[:4, :4].copy(), C[:4, :4].copy(), min(n, 4))
+        # Full-size warm-up outside the timed region, measured so it doubles as the
+        # per-experiment memory probe (host tracemalloc, or the device pool for CuPy)
+        mem_used = probe_mb(mm, A, B, C, n)
+        print(f"Memory used (warm-up call): {mem_used:.2f} MB")
 
-    total = 0.0
+    times = []
+    rows = []
     for r in range(1, runs + 1):
-        mem_before = get_memory_mb()
-        t0 = time.perf_counter()
-        C = matrix_multiply(A, B, n)
-        t1 = time.perf_counter()
-        mem_after = get_memory_mb()
+        gc.collect()
+        # No collector pauses inside the timed region
+        gc.disable()
+        t0 = time.perf_counter_ns()
+        mm(A, B, C, n)
+        t1 = time.perf_counter_ns()
+        gc.enable()
 
-        elapsed = t1 - t0
-        mem_used = max(0.0, mem_after - mem_before)
-        total += elapsed
+        elapsed = (t1 - t0) / 1e9
+        times.append(elapsed)
 
-        print(f"Run {r}: {elapsed:.6f} s | Memory used: {mem_used:.2f} MB")
-        log_csv(n, r, elapsed, mem_used)
+        print(f"Run {r}: {elapsed:.6f} s")
+        rows.append([LANGUAGE_TAGS[backend], n, r, f"{elapsed:.6f}", "", ts, dtype])
 
         # Prevent C from being optimized away by interpreter (noop read)
-        if C and C[0] and C[0][0] == float("nan"):
+        if len(C) and C[0][0] == float("nan"):
             print("", end="")
 
+    if mem_used is None:
+        # The pure-Python loop has no warm-up to reuse: trace one extra untimed call after
+        # the timed runs (tracemalloc slows this loop ~10x, so it must stay out of them)
+        mem_used = traced_peak_mb(mm, A, B, C, n)
+        print(f"Memory used (traced call): {mem_used:.2f} MB")
+    # Memory is measured once per experiment: logged on run 1 only so the plots
+    # do not show a fake zero spread across runs
+    rows[0][4] = f"{mem_used:.2f}"
+
+    # Run 1 is treated as warm-up and excluded from the robust statistics
+    steady = np.array(times[1:] if len(times) > 1 else times)
+    median = float(np.median(steady))
+    mad = float(np.median(np.abs(steady - median)))
+    for row in rows:
+        row += [f"{median:.9f}", f"{mad:.9f}"]
+
+    # Single write after all runs keeps file I/O out of the measured loop
+    log_csv(rows)
+
     print("---------------------------------------")
-    print(f"Average time: {total / runs:.6f} s")
+    print(f"Average time: {sum(times) / runs:.6f} s")
+    print(f"Median time: {median:.6f} s | MAD: {mad:.6f} s")
     print("=======================================")
 
 if __name__ == "__main__":
-    if len(sys.argv) < 3:
-        print("Usage: python benchmarks/benchmark.py <matrix_size> <num_runs>")
-        sys.exit(1)
-    n = int(sys.argv[1])
-    runs = int(sys.argv[2])
-    run_experiment(n, runs)
+    ap = argparse.ArgumentParser(description="Python matrix multiplication benchmark")
+    ap.add_argument("matrix_size", type=int)
+    ap.add_argument("num_runs", type=int)
+    ap.add_argument("--backend", default="numpy", choices=list(LANGUAGE_TAGS))
+    ap.add_argument("--dtype", default="f64", choices=list(DTYPES))
+    args = ap.parse_args()
+    run_experiment(args.matrix_size, args.num_runs, args.backend, args.dtype)
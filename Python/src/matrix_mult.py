@@ -1,11 +1,50 @@
-def matrix_multiply(A, B, n):
-    C = [[0.0 for _ in range(n)] for _ in range(n)]
+import numpy as np
+
+
+def matrix_multiply(A, B, C, n):
+    assert A.shape == (n, n) and B.shape == (n, n)
+    np.matmul(A, B, out=C)
+
+
+def matrix_multiply_python(A, B, C, n):
+    BT = [list(col) for col in zip(*B)]
     for i in range(n):
         Ai = A[i]
         Ci = C[i]
         for j in range(n):
+            Bj = BT[j]
             s = 0.0
             for k in range(n):
-                s += Ai[k] * B[k][j]
+                s += Ai[k] * Bj[k]
             Ci[j] = s
+
+
+def strassen(A, B, cutoff=512):
+    n = A.shape[0]
+    if n <= cutoff or n % 2:
+        return A @ B
+    h = n // 2
+    A11, A12, A21, A22 = A[:h, :h], A[:h, h:], A[h:, :h], A[h:, h:]
+    B11, B12, B21, B22 = B[:h, :h], B[:h, h:], B[h:, :h], B[h:, h:]
+    M1 = strassen(A11 + A22, B11 + B22, cutoff)
+    M2 = strassen(A21 + A22, B11, cutoff)
+    M3 = strassen(A11, B12 - B22, cutoff)
+    M4 = strassen(A22, B21 - B11, cutoff)
+    M5 = strassen(A11 + A12, B22, cutoff)
+    M6 = strassen(A21 - A11, B11 + B12, cutoff)
+    M7 = strassen(A12 - A22, B21 + B22, cutoff)
+    C = np.empty_like(M1, shape=(n, n))
+    C[:h, :h] = M1 + M4 - M5 + M7
+    C[:h, h:] = M3 + M5
+    C[h:, :h] = M2 + M4
+    C[h:, h:] = M1 - M2 + M3 + M6
     return C
+
+
+def matrix_multiply_strassen(A, B, C, n, cutoff=512):
+    assert A.shape == (n, n) and B.shape == (n, n)
+    if n <= cutoff or n % 2:
+        # Base case: no recursion, write straight into the out buffer
+        np.matmul(A, B, out=C)
+    else:
+        C[:, :] = strassen(A, B, cutoff)
@@ -0,0 +1,20 @@
+import cupy as cp
+
+
+def to_device(M):
+    return cp.asarray(M)
+
+
+def matrix_multiply_cupy(A, B, C, n):
+    cp.matmul(A, B, out=C)
+    # Kernel launches are asynchronous: wait so the caller's timer covers the GEMM
+    cp.cuda.runtime.deviceSynchronize()
+
+
+def device_peak_mb(mm, A, B, C, n):
+    # Growth of the default device pool across one call: freed temporaries stay
+    # cached in the pool, so this covers the call's peak rather than its net usage
+    pool = cp.get_default_memory_pool()
+    before = pool.total_bytes()
+    mm(A, B, C, n)
+    return max(0, pool.total_bytes() - before) / (1024**2)
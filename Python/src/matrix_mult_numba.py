@@ -0,0 +1,136 @@
+import numpy as np
+from numba import njit, prange
+
+# C-contiguous 2-D operands: lets LLVM use unit-stride vector loads
+GEMM_SIGNATURES = [
+    "void(f4[:, ::1], f4[:, ::1], f4[:, ::1], i8)",
+    "void(f8[:, ::1], f8[:, ::1], f8[:, ::1], i8)",
+]
+
+
+@njit(GEMM_SIGNATURES, parallel=True, fastmath=True, boundscheck=False, error_model="numpy", cache=True)
+def matrix_multiply_numba(A, B, C, n):
+    for i in prange(n):
+        for j in range(n):
+            s = C.dtype.type(0)
+            for k in range(n):
+                s += A[i, k] * B[k, j]
+            C[i, j] = s
+
+
+BM = 32
+BN = 32
+BK = 32
+
+
+@njit(GEMM_SIGNATURES, parallel=True, fastmath=True, boundscheck=False, error_model="numpy", cache=True)
+def matrix_multiply_tiled(A, B, C, n):
+    C[:, :] = 0.0
+    for ii in prange((n + BM - 1) // BM):
+        i0 = ii * BM
+        for jj in range(0, n, BN):
+            for kk in range(0, n, BK):
+                for i in range(i0, min(i0 + BM, n)):
+                    for j in range(jj, min(jj + BN, n)):
+                        s = C[i, j]
+                        for k in range(kk, min(kk + BK, n)):
+                            s += A[i, k] * B[k, j]
+                        C[i, j] = s
+
+
+# Packed GEMM (GotoBLAS/BLIS decomposition)
+MR = 6
+NR = 16
+MC = 96
+KC = 384
+NC = 128
+
+
+def _empty_aligned(size, dtype=np.float64, align=64):
+    itemsize = np.dtype(dtype).itemsize
+    buf = np.empty(size + align // itemsize, dtype=dtype)
+    offset = (-buf.ctypes.data % align) // itemsize
+    return buf[offset:offset + size]
+
+
+@njit(fastmath=True, boundscheck=False, error_model="numpy", cache=True)
+def _pack_A(A, Ap, ic, pc, mc, kc):
+    # MR-row slivers, each stored k-major: Ap[ir*kc + p*MR + i] = A[ic+ir+i, pc+p]
+    for ir in range(0, mc, MR):
+        base = ir * kc
+        for p in range(kc):
+            for i in range(MR):
+                if ir + i < mc:
+                    Ap[base + p * MR + i] = A[ic + ir + i, pc + p]
+                else:
+                    Ap[base + p * MR + i] = 0.0
+
+
+@njit(fastmath=True, boundscheck=False, error_model="numpy", cache=True)
+def _pack_B(B, Bp, pc, jc, kc, nc):
+    # NR-column slivers, each stored k-major: Bp[jr*kc + p*NR + j] = B[pc+p, jc+jr+j]
+    for jr in range(0, nc, NR):
+        base = jr * kc
+        for p in range(kc):
+            for j in range(NR):
+                if jr + j < nc:
+                    Bp[base + p * NR + j] = B[pc + p, jc + jr + j]
+                else:
+                    Bp[base + p * NR + j] = 0.0
+
+
+@njit(fastmath=True, boundscheck=False, error_model="numpy", cache=True)
+def _micro_kernel(Ap, a_off, Bp, b_off, kc, acc):
+    # 6x16 register tile: one broadcast of A against NR contiguous B values per row
+    acc[:, :] = 0.0
+    for p in range(kc):
+        a = Ap[a_off + p * MR:a_off + (p + 1) * MR]
+        b = Bp[b_off + p * NR:b_off + (p + 1) * NR]
+        for i in range(MR):
+            ai = a[i]
+            for j in range(NR):
+                acc[i, j] += ai * b[j]
+
+
+@njit(fastmath=True, boundscheck=False, error_model="numpy", cache=True)
+def _macro_kernel(Ap, Bp, C, ic, jc, mc, nc, kc, acc):
+    for jr in range(0, nc, NR):
+        for ir in range(0, mc, MR):
+            _micro_kernel(Ap, ir * kc, Bp, jr * kc, kc, acc)
+            for i in range(min(MR, mc - ir)):
+                for j in range(min(NR, nc - jr)):
+                    C[ic + ir + i, jc + jr + j] += acc[i, j]
+
+
+# Eager signatures so all JIT compilation happens at import, never inside the
+# benchmark's traced warm-up call
+PACKED_SIGNATURES = [
+    "void(f4[:, ::1], f4[:, ::1], f4[:, ::1], i8, f4[::1], f4[::1])",
+    "void(f8[:, ::1], f8[:, ::1], f8[:, ::1], i8, f8[::1], f8[::1])",
+]
+
+
+@njit(PACKED_SIGNATURES, parallel=True, fastmath=True, boundscheck=False, error_model="numpy", cache=True)
+def _gemm_packed(A, B, C, n, Ap, Bp):
+    C[:, :] = 0.0
+    n_ic = (n + MC - 1) // MC
+    n_jc = (n + NC - 1) // NC
+    for pc in range(0, n, KC):
+        kc = min(KC, n - pc)
+        # Full A and B panels for this pc are packed once into the shared aligned
+        # buffers; the parallel loop below only reads them
+        _pack_A(A, Ap, 0, pc, n, kc)
+        _pack_B(B, Bp, pc, 0, kc, n)
+        # One task per (jc, ic) block: each owns a disjoint MC x NC block of C
+        for t in prange(n_jc * n_ic):
+            jc = (t // n_ic) * NC
+            ic = (t % n_ic) * MC
+            acc = np.empty((MR, NR), dtype=A.dtype)
+            _macro_kernel(Ap[ic * kc:], Bp[jc * kc:], C, ic, jc, min(MC, n - ic), min(NC, n - jc), kc, acc)
+
+
+def matrix_multiply_packed(A, B, C, n):
+    kc = min(KC, n)
+    Ap = _empty_aligned(-(-n // MR) * MR * kc, A.dtype)
+    Bp = _empty_aligned(-(-n // NR) * NR * kc, A.dtype)
+    _gemm_packed(A, B, C, n, Ap, Bp)
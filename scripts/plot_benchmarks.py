@@ -4,14 +4,15 @@ Generates comparative figures (grouped bar charts + improved boxplots) and
 a LaTeX snippet that includes them.
 
 Input CSV schema:
-  language,matrix_size,run_index,elapsed_sec,memory_used_mb,timestamp_iso
+  language,matrix_size,run_index,elapsed_sec,memory_used_mb,timestamp_iso,dtype,median_sec,mad_sec
 
 Usage (from repo root):
   python scripts/plot_benchmarks.py
   python scripts/plot_benchmarks.py --csv data/results.csv --out paper/figures --show
 
 Requirements:
-  pip install pandas matplotlib
+  pip install pandas "matplotlib>=3.9"
+  pip install pyarrow   # optional, faster CSV parsing
 """
 
 from __future__ import annotations
@@ -22,6 +23,24 @@ import math
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib import colormaps
+
+try:
+    import pyarrow  # noqa: F401  (optional: faster CSV parsing)
+    CSV_ENGINE = "pyarrow"
+except ImportError:
+    CSV_ENGINE = "c"
+
+CSV_COLUMNS = ["language", "matrix_size", "run_index", "elapsed_sec", "memory_used_mb", "timestamp_iso",
+               "dtype", "median_sec", "mad_sec"]
+
+CSV_DTYPES = {
+    "language": "category",
+    "matrix_size": "int32",
+    "run_index": "int32",
+    "elapsed_sec": "float64",
+    "memory_used_mb": "float64",
+}
 
 
 # -------------------- IO & summary -------------------- #
@@ -29,23 +48,38 @@ import matplotlib.pyplot as plt
 def load_data(csv_path: Path) -> pd.DataFrame:
     if not csv_path.exists():
         raise FileNotFoundError(f"[ERROR] CSV not found: {csv_path}")
-    df = pd.read_csv(csv_path)
+    header = pd.read_csv(csv_path, nrows=0).columns
     expected = {"language", "matrix_size", "run_index", "elapsed_sec", "memory_used_mb", "timestamp_iso"}
-    missing = expected - set(df.columns)
+    missing = expected - set(header)
     if missing:
         raise ValueError(f"[ERROR] Missing columns in CSV: {sorted(missing)}")
 
-    df["language"] = df["language"].astype(str)
-    df["matrix_size"] = df["matrix_size"].astype(int)
-    df["run_index"] = df["run_index"].astype(int)
-    df["elapsed_sec"] = df["elapsed_sec"].astype(float)
-    df["memory_used_mb"] = df["memory_used_mb"].astype(float)
+    # dtypes applied while parsing (single pass); language as category instead of object strings
+    try:
+        df = pd.read_csv(csv_path, engine=CSV_ENGINE, dtype=CSV_DTYPES)
+    except pd.errors.ParserError:
+        # PyArrow rejects ragged rows (e.g. 6-column rows from writers predating the
+        # current schema); the C parser pads them with NaN. A file whose header itself
+        # predates the schema gets the full column list, so newer, wider rows still parse.
+        if list(header) == CSV_COLUMNS[:len(header)]:
+            df = pd.read_csv(csv_path, engine="c", dtype=CSV_DTYPES, names=CSV_COLUMNS, header=None, skiprows=1)
+        else:
+            df = pd.read_csv(csv_path, engine="c", dtype=CSV_DTYPES)
+
+    # Fold non-default precision into the series label (e.g. "PythonNumPy-f32") so f32 and
+    # f64 runs are never averaged together; rows without a dtype are f64
+    if "dtype" in df.columns:
+        precision = df["dtype"].fillna("f64").astype(str)
+        reduced = precision != "f64"
+        if reduced.any():
+            label = df["language"].astype(str).where(~reduced, df["language"].astype(str) + "-" + precision)
+            df["language"] = label.astype("category")
     return df
 
 
 def summarize(df: pd.DataFrame) -> pd.DataFrame:
     return (
-        df.groupby(["language", "matrix_size"])
+        df.groupby(["language", "matrix_size"], observed=True)
           .agg(
               runs=("run_index", "count"),
               avg_time_s=("elapsed_sec", "mean"),
@@ -62,7 +96,7 @@ def summarize(df: pd.DataFrame) -> pd.DataFrame:
 
 def color_cycle(n: int):
     # stable palette from tab10 for consistency across figs
-    cmap = plt.cm.get_cmap("tab10")
+    cmap = colormaps["tab10"]
     return [cmap(i % 10) for i in range(n)]
 
 
@@ -70,37 +104,37 @@ def color_cycle(n: int):
 
 def fig_avg_time(summary: pd.DataFrame, outdir: Path, show: bool = False) -> Path:
     p = outdir / "avg_time_by_language.png"
-    plt.figure()
-    for lang, g in summary.groupby("language"):
+    fig, ax = plt.subplots()
+    for lang, g in summary.groupby("language", observed=True):
         g = g.sort_values("matrix_size")
-        plt.plot(g["matrix_size"], g["avg_time_s"], marker="o", label=lang)
-    plt.xlabel("Matrix size (n)")
-    plt.ylabel("Average elapsed time (s)")
-    plt.title("Average Time vs Size")
-    plt.grid(True, axis="y")
-    plt.legend()
-    plt.tight_layout()
-    plt.savefig(p, bbox_inches="tight")
+        ax.plot(g["matrix_size"], g["avg_time_s"], marker="o", label=lang)
+    ax.set_xlabel("Matrix size (n)")
+    ax.set_ylabel("Average elapsed time (s)")
+    ax.set_title("Average Time vs Size")
+    ax.grid(True, axis="y")
+    ax.legend()
+    fig.tight_layout()
+    fig.savefig(p, bbox_inches="tight")
     if show: plt.show()
-    plt.close()
+    plt.close(fig)
     return p
 
 
 def fig_avg_mem(summary: pd.DataFrame, outdir: Path, show: bool = False) -> Path:
     p = outdir / "avg_memory_by_language.png"
-    plt.figure()
-    for lang, g in summary.groupby("language"):
+    fig, ax = plt.subplots()
+    for lang, g in summary.groupby("language", observed=True):
         g = g.sort_values("matrix_size")
-        plt.plot(g["matrix_size"], g["avg_mem_mb"], marker="o", label=lang)
-    plt.xlabel("Matrix size (n)")
-    plt.ylabel("Average memory used (MB)")
-    plt.title("Average Memory vs Size")
-    plt.grid(True, axis="y")
-    plt.legend()
-    plt.tight_layout()
-    plt.savefig(p, bbox_inches="tight")
+        ax.plot(g["matrix_size"], g["avg_mem_mb"], marker="o", label=lang)
+    ax.set_xlabel("Matrix size (n)")
+    ax.set_ylabel("Average memory used (MB)")
+    ax.set_title("Average Memory vs Size")
+    ax.grid(True, axis="y")
+    ax.legend()
+    fig.tight_layout()
+    fig.savefig(p, bbox_inches="tight")
     if show: plt.show()
-    plt.close()
+    plt.close(fig)
     return p
 
 
@@ -117,19 +151,19 @@ def fig_speedup_vs_python(summary: pd.DataFrame, outdir: Path, show: bool = Fals
     speedup[["language", "matrix_size", "speedup_vs_python"]].to_csv(tbl_path, index=False)
 
     p = outdir / "speedup_vs_python.png"
-    plt.figure()
-    for lang, g in speedup.groupby("language"):
+    fig, ax = plt.subplots()
+    for lang, g in speedup.groupby("language", observed=True):
         g = g.sort_values("matrix_size")
-        plt.plot(g["matrix_size"], g["speedup_vs_python"], marker="o", label=lang)
-    plt.xlabel("Matrix size (n)")
-    plt.ylabel("Speedup vs Python (×)")
-    plt.title("Speedup Relative to Python")
-    plt.grid(True, axis="y")
-    plt.legend()
-    plt.tight_layout()
-    plt.savefig(p, bbox_inches="tight")
+        ax.plot(g["matrix_size"], g["speedup_vs_python"], marker="o", label=lang)
+    ax.set_xlabel("Matrix size (n)")
+    ax.set_ylabel("Speedup vs Python (×)")
+    ax.set_title("Speedup Relative to Python")
+    ax.grid(True, axis="y")
+    ax.legend()
+    fig.tight_layout()
+    fig.savefig(p, bbox_inches="tight")
     if show: plt.show()
-    plt.close()
+    plt.close(fig)
     return p, tbl_path
 
 
@@ -150,24 +184,24 @@ def grouped_bar(summary: pd.DataFrame, value_col: str, err_col: str, ylabel: str
     width = 0.8 / max(1, len(langs))  # total width <= 0.8
     x = np.arange(len(sizes))  # group centers
 
-    plt.figure(figsize=(max(6, len(sizes)*0.9), 4.8))
+    fig, ax = plt.subplots(figsize=(max(6, len(sizes)*0.9), 4.8))
     for i, lg in enumerate(langs):
         g = summary[summary["language"] == lg].set_index("matrix_size").reindex(sizes)
         vals = g[value_col].to_numpy()
         errs = g[err_col].to_numpy() if err_col in g else np.zeros_like(vals)
-        plt.bar(x + i*width - (len(langs)-1)*width/2, vals, width, yerr=errs, capsize=3,
+        ax.bar(x + i*width - (len(langs)-1)*width/2, vals, width, yerr=errs, capsize=3,
                 label=lg, color=colors[i], edgecolor="black")
 
-    plt.xticks(x, [str(s) for s in sizes])
-    plt.xlabel("Matrix size (n)")
-    plt.ylabel(ylabel)
-    plt.title(f"{ylabel} — Grouped by Language")
-    plt.grid(True, axis="y", alpha=0.35)
-    plt.legend(ncol=min(4, len(langs)))
-    plt.tight_layout()
-    plt.savefig(p, bbox_inches="tight")
+    ax.set_xticks(x, [str(s) for s in sizes])
+    ax.set_xlabel("Matrix size (n)")
+    ax.set_ylabel(ylabel)
+    ax.set_title(f"{ylabel} — Grouped by Language")
+    ax.grid(True, axis="y", alpha=0.35)
+    ax.legend(ncol=min(4, len(langs)))
+    fig.tight_layout()
+    fig.savefig(p, bbox_inches="tight")
     if show: plt.show()
-    plt.close()
+    plt.close(fig)
     return p
 
 
@@ -189,12 +223,16 @@ def box_grid(df: pd.DataFrame, metric_col: str, ylabel: str, filename: str,
     fig, axes = plt.subplots(nrows=nrows, ncols=ncols, figsize=(4*ncols, 3.2*nrows), squeeze=False)
     colors = color_cycle(len(langs))
 
+    # one pass over df instead of a boolean-mask scan per (size, language) cell
+    # blank cells (e.g. memory logged only on run 1) are dropped rather than plotted as NaN
+    arrays = {k: v.dropna().to_numpy() for k, v in df.groupby(["matrix_size", "language"], observed=True)[metric_col]}
+    empty = np.array([])
+
     for idx, size in enumerate(sizes):
         r, c = divmod(idx, ncols)
         ax = axes[r][c]
-        sub = df[df["matrix_size"] == size]
-        data = [sub[sub["language"] == lg][metric_col].to_numpy() for lg in langs]
-        bp = ax.boxplot(data, labels=langs, patch_artist=True, showfliers=True)
+        data = [arrays.get((size, lg), empty) for lg in langs]
+        bp = ax.boxplot(data, tick_labels=langs, patch_artist=True, showfliers=True)
         # style boxes
         for patch, col in zip(bp['boxes'], colors):
             patch.set(facecolor=col, alpha=0.6, edgecolor="black")
@@ -216,9 +254,9 @@ def box_grid(df: pd.DataFrame, metric_col: str, ylabel: str, filename: str,
 
     fig.suptitle(f"{ylabel} — Boxplots by Language and Size", y=0.98)
     fig.tight_layout()
-    plt.savefig(p, bbox_inches="tight")
+    fig.savefig(p, bbox_inches="tight")
     if show: plt.show()
-    plt.close()
+    plt.close(fig)
     return p
 
 